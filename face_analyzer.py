@@ -120,3 +120,8 @@ class FaceAnalyzer:
             # 결과가 오래되었으면 빈 리스트 반환
             return []
 
+    def clear_results(self):
+        """저장된 분석 결과 해제 (메모리 압박 시 캐시 비우기)"""
+        with self.lock:
+            self.last_results = []
+            self.last_result = None
@@ -0,0 +1,315 @@
+"""
+프레임 녹화/재생 모듈
+Frame Record & Replay Module
+
+카메라 프레임을 타임스탬프와 함께 청크 단위 원본(raw) .npy 파일로 저장하고,
+메모리 맵(memmap)으로 다시 읽어 카메라 없이 동일한 파이프라인을 재현한다.
+
+저장 구조:
+    <record_dir>/
+        index.json          # 프레임 형태, 청크 목록, 프레임 수
+        chunk_00000.npy     # (chunk_size, H, W, C) uint8 프레임 배열
+        chunk_00000_ts.npy  # (chunk_size,) float64 타임스탬프
+        ...
+"""
+
+import bisect
+import json
+import os
+import queue
+import threading
+import time
+from typing import Optional, Dict, List, Tuple
+
+import numpy as np
+
+
+INDEX_FILE = "index.json"
+FORMAT_VERSION = 1
+
+
+def _chunk_names(chunk_idx: int) -> Tuple[str, str]:
+    """청크 프레임/타임스탬프 파일 이름 반환"""
+    base = f"chunk_{chunk_idx:05d}"
+    return f"{base}.npy", f"{base}_ts.npy"
+
+
+class FrameRecorder:
+    """카메라 프레임을 청크 단위 메모리 맵 파일로 녹화하는 클래스
+
+    UI 스레드는 프레임 복사본을 큐에 넣기만 하고, 메모리 맵 쓰기와
+    flush는 별도 writer 스레드에서 수행한다.
+    """
+
+    def __init__(self, record_dir: str, chunk_size: int = 16, queue_size: int = 8,
+                 low_memory_chunk_size: int = 2):
+        """
+        Args:
+            record_dir: 녹화 파일을 저장할 디렉터리 (이미 녹화가 있으면 FileExistsError)
+            chunk_size: 청크 하나에 저장할 프레임 수 (기본값: 16프레임)
+            queue_size: writer 스레드 대기 큐 크기 (가득 차면 프레임을 버림)
+            low_memory_chunk_size: 저메모리 모드에서 청크 하나에 저장할 프레임 수
+        """
+        if os.path.exists(os.path.join(record_dir, INDEX_FILE)):
+            raise FileExistsError(f"Recording already exists: {record_dir}")
+        self.record_dir = record_dir
+        self.chunk_size = chunk_size
+        self.low_memory_chunk_size = low_memory_chunk_size
+        self.chunk_limit = chunk_size  # 현재 청크를 닫는 프레임 수 (writer 스레드가 읽음)
+        self.frame_shape: Optional[Tuple[int, ...]] = None
+        self.dtype: Optional[str] = None
+        self.chunks: List[Dict] = []  # 완료된 청크 정보 (파일명, 프레임 수)
+        self.frame_count = 0
+        self.dropped_frames = 0  # 큐가 가득 차서 버린 프레임 수
+        self.skipped_frames = 0  # 첫 프레임과 해상도가 달라 기록하지 않은 프레임 수
+        self.error: Optional[BaseException] = None  # writer 스레드에서 발생한 오류
+        self._chunk: Optional[np.memmap] = None
+        self._chunk_ts: Optional[np.memmap] = None
+        self._chunk_fill = 0
+        self._closed = False
+        os.makedirs(record_dir, exist_ok=True)
+
+        self._queue: "queue.Queue[Optional[Tuple[np.ndarray, float]]]" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
+    def _open_chunk(self):
+        """새 청크 파일을 메모리 맵으로 생성"""
+        frames_name, ts_name = _chunk_names(len(self.chunks))
+        self._chunk = np.lib.format.open_memmap(
+            os.path.join(self.record_dir, frames_name),
+            mode="w+",
+            dtype=self.dtype,
+            shape=(self.chunk_limit,) + self.frame_shape
+        )
+        self._chunk_ts = np.lib.format.open_memmap(
+            os.path.join(self.record_dir, ts_name),
+            mode="w+",
+            dtype=np.float64,
+            shape=(self.chunk_limit,)
+        )
+        self._chunk_fill = 0
+
+    def _close_chunk(self):
+        """현재 청크를 디스크에 반영하고 인덱스 갱신"""
+        if self._chunk is None:
+            return
+        frames_name, ts_name = _chunk_names(len(self.chunks))
+        self._chunk.flush()
+        self._chunk_ts.flush()
+        self.chunks.append({
+            "frames": frames_name,
+            "timestamps": ts_name,
+            "count": self._chunk_fill
+        })
+        self._chunk = None
+        self._chunk_ts = None
+        self._chunk_fill = 0
+        self._write_index()
+
+    def _write_index(self):
+        """인덱스 파일 기록 (임시 파일 후 교체)"""
+        index = {
+            "version": FORMAT_VERSION,
+            "frame_shape": list(self.frame_shape) if self.frame_shape else None,
+            "dtype": self.dtype,
+            "chunk_size": self.chunk_size,
+            "frame_count": self.frame_count,
+            "dropped_frames": self.dropped_frames,
+            "skipped_frames": self.skipped_frames,
+            "error": repr(self.error) if self.error else None,
+            "chunks": self.chunks
+        }
+        tmp_path = os.path.join(self.record_dir, INDEX_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.record_dir, INDEX_FILE))
+
+    def _writer_loop(self):
+        """writer 스레드: 큐의 프레임을 청크에 기록 (None을 받으면 종료)
+
+        기록 중 오류가 나면 error에 저장하고 이후 프레임은 버리면서 큐를 계속 비운다.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self._write_frame(*item)
+            except Exception as e:
+                self.error = e
+
+        try:
+            self._close_chunk()
+            self._write_index()
+        except Exception as e:
+            if self.error is None:
+                self.error = e
+
+    def _write_frame(self, frame: np.ndarray, timestamp: float):
+        """프레임 한 장을 현재 청크에 기록 (writer 스레드)"""
+        # 저메모리 모드로 바뀌었으면 열려 있는 큰 청크를 먼저 닫음
+        if self._chunk is not None and self._chunk_fill >= self.chunk_limit:
+            self._close_chunk()
+        if self._chunk is None:
+            self._open_chunk()
+
+        self._chunk[self._chunk_fill] = frame
+        self._chunk_ts[self._chunk_fill] = timestamp
+        self._chunk_fill += 1
+        self.frame_count += 1
+
+        if self._chunk_fill >= min(self.chunk_limit, len(self._chunk)):
+            self._close_chunk()
+
+    def write(self, frame: np.ndarray, timestamp: Optional[float] = None):
+        """프레임 한 장 기록 요청 (원본 그대로 복사, 인코딩 없음, 블로킹 없음)"""
+        if self._closed or self.error is not None:
+            return
+        if self.frame_shape is None:
+            self.frame_shape = tuple(frame.shape)
+            self.dtype = str(frame.dtype)
+        elif tuple(frame.shape) != self.frame_shape:
+            # 해상도가 바뀐 프레임은 재생 시 형태가 달라지므로 기록하지 않음
+            self.skipped_frames += 1
+            return
+
+        # 파이프라인이 이후 프레임 위에 직접 그리므로 복사본을 넘김
+        item = (frame.copy(), time.time() if timestamp is None else timestamp)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # UI 루프를 막지 않도록 디스크가 따라오지 못하면 프레임을 버림
+            self.dropped_frames += 1
+
+    def set_low_memory(self, enabled: bool):
+        """저메모리 모드 설정 (청크를 작게 나눠 flush되지 않은 memmap 페이지를 줄임)"""
+        self.chunk_limit = self.low_memory_chunk_size if enabled else self.chunk_size
+
+    def close(self, timeout: float = 5.0):
+        """녹화 종료 (대기 중인 프레임, 마지막 청크 및 인덱스 기록)
+
+        writer 스레드가 멈춰 있어도 UI가 멈추지 않도록 최대 timeout초만 기다린다.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            if self.error is None:
+                self.error = TimeoutError("Recorder writer thread did not drain the queue")
+            return
+        self._thread.join(timeout)
+
+
+class FrameReplaySource:
+    """녹화된 프레임을 재생하는 cv2.VideoCapture 호환 소스"""
+
+    def __init__(self, record_dir: str, realtime: bool = True, loop: bool = False):
+        """
+        Args:
+            record_dir: FrameRecorder로 녹화한 디렉터리
+            realtime: True면 원래 타이밍대로, False면 최대 속도로 재생
+            loop: 끝까지 재생한 뒤 처음부터 다시 재생할지 여부
+        """
+        self.record_dir = record_dir
+        self.realtime = realtime
+        self.loop = loop
+        self.chunks: List[Dict] = []
+        self.frame_count = 0
+        self.position = 0  # 다음에 읽을 프레임 번호
+        self._opened = False
+        self._loaded: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}  # 열린 청크 memmap
+        self._offsets: List[int] = []  # 각 청크의 시작 프레임 번호
+        self._start_wall: Optional[float] = None
+        self._start_ts: Optional[float] = None
+
+        index_path = os.path.join(record_dir, INDEX_FILE)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        self.chunks = [c for c in index.get("chunks", []) if c.get("count", 0) > 0]
+        offset = 0
+        for chunk in self.chunks:
+            self._offsets.append(offset)
+            offset += chunk["count"]
+        self.frame_count = offset
+        self._opened = self.frame_count > 0
+
+    def isOpened(self) -> bool:
+        """재생 가능 여부 (cv2.VideoCapture 호환)"""
+        return self._opened
+
+    def _get_chunk(self, chunk_idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        """청크를 메모리 맵으로 열기 (이미 열려 있으면 재사용)"""
+        if chunk_idx not in self._loaded:
+            chunk = self.chunks[chunk_idx]
+            frames = np.load(os.path.join(self.record_dir, chunk["frames"]), mmap_mode="r")
+            timestamps = np.load(os.path.join(self.record_dir, chunk["timestamps"]), mmap_mode="r")
+            # 재생이 진행되면 지난 청크는 더 이상 필요 없으므로 닫음
+            self.evict(keep=chunk_idx)
+            self._loaded[chunk_idx] = (frames, timestamps)
+        return self._loaded[chunk_idx]
+
+    def _locate(self, position: int) -> Tuple[int, int]:
+        """전체 프레임 번호를 (청크 번호, 청크 내 위치)로 변환"""
+        chunk_idx = bisect.bisect_right(self._offsets, position) - 1
+        return chunk_idx, position - self._offsets[chunk_idx]
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """다음 프레임 읽기 (cv2.VideoCapture.read 호환)
+
+        실시간 모드에서 아직 재생 시각이 되지 않았으면 블로킹하지 않고
+        (False, None)을 반환하므로 호출 측은 카메라와 동일하게 재시도하면 된다.
+        """
+        if not self._opened:
+            return False, None
+
+        if self.position >= self.frame_count:
+            if not self.loop:
+                return False, None
+            self.position = 0
+            self._start_wall = None
+
+        chunk_idx, local_idx = self._locate(self.position)
+        frames, timestamps = self._get_chunk(chunk_idx)
+        timestamp = float(timestamps[local_idx])
+
+        if self.realtime:
+            now = time.time()
+            if self._start_wall is None:
+                self._start_wall = now
+                self._start_ts = timestamp
+            elif now - self._start_wall < timestamp - self._start_ts:
+                return False, None
+
+        self.position += 1
+        # 파이프라인이 프레임 위에 직접 그리므로 읽기 전용 memmap 대신 복사본 반환
+        return True, np.array(frames[local_idx])
+
+    def is_finished(self) -> bool:
+        """반복 재생이 아니고 마지막 프레임까지 모두 읽었는지 여부"""
+        return not self.loop and self.position >= self.frame_count
+
+    def set(self, prop_id: int, value: float) -> bool:
+        """카메라 속성 설정 (재생 소스에서는 지원하지 않음)"""
+        return False
+
+    def evict(self, keep: Optional[int] = None):
+        """열려 있는 청크 memmap 해제"""
+        for chunk_idx in list(self._loaded):
+            if chunk_idx != keep:
+                del self._loaded[chunk_idx]
+
+    def release(self):
+        """재생 종료 (cv2.VideoCapture.release 호환)"""
+        self.evict()
+        self._opened = False
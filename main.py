@@ -6,10 +6,37 @@ Real-time Face Recognition with Age, Gender, and Emotion Detection
 Main Entry Point
 """
 
+import argparse
+
 from ui import App
 
 
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="AI Face Analysis Dashboard")
+    parser.add_argument("--record", metavar="DIR",
+                        help="카메라 프레임을 DIR 아래 세션별 하위 디렉터리에 녹화")
+    parser.add_argument("--replay", metavar="DIR", help="웹캠 대신 DIR의 녹화 프레임 재생")
+    parser.add_argument("--replay-fast", action="store_true",
+                        help="원래 타이밍을 무시하고 최대 속도로 재생")
+    parser.add_argument("--replay-loop", action="store_true",
+                        help="재생이 끝나면 처음부터 반복")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="tracemalloc 스냅샷, 단계별 할당량, RSS를 memory_profile.log에 기록")
+    parser.add_argument("--memory-budget-mb", type=float, metavar="MB",
+                        help="메모리 예산 (초과 시 미리보기 해상도/분석 빈도를 낮추고 캐시 해제)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    app = App()
+    args = parse_args()
+    app = App(
+        record_dir=args.record,
+        replay_dir=args.replay,
+        replay_realtime=not args.replay_fast,
+        replay_loop=args.replay_loop,
+        profile_memory=args.profile_memory,
+        memory_budget_mb=args.memory_budget_mb
+    )
     app.protocol("WM_DELETE_WINDOW", app.on_closing)  # X 버튼 눌렀을 때
     app.mainloop()
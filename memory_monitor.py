@@ -0,0 +1,276 @@
+"""
+메모리 모니터링 모듈
+Memory Monitoring Module
+
+장시간 실행 시 메모리 증가를 추적하기 위한 선택적 프로파일링
+(tracemalloc 스냅샷, 단계별 할당량, RSS 샘플링, GC 정지 시간)과
+메모리 예산 초과 시 단계적으로 부하를 줄이는 기능을 제공한다.
+"""
+
+import contextlib
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Optional, Dict, Callable
+
+try:
+    import psutil
+except ImportError:  # 선택적 의존성
+    psutil = None
+
+
+# 메모리 압박 단계
+PRESSURE_NORMAL = 0  # 정상
+PRESSURE_REDUCED = 1  # 미리보기 해상도 및 분석 빈도 낮춤
+PRESSURE_CRITICAL = 2  # 미리보기 추가 축소, 캐시 해제, 녹화 버퍼 축소, gc.collect()
+
+
+def _get_rss_windows() -> Optional[int]:
+    """Windows에서 현재 프로세스 RSS(Working Set) 조회"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.WorkingSetSize
+
+
+def get_rss_bytes() -> Optional[int]:
+    """현재 프로세스의 RSS(바이트) 반환 (측정 불가 시 None)"""
+    try:
+        if psutil is not None:
+            return psutil.Process().memory_info().rss
+        if sys.platform == "win32":
+            return _get_rss_windows()
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+class MemoryMonitor:
+    """메모리 프로파일링 및 메모리 예산 관리 클래스"""
+
+    def __init__(self, profile: bool = False, budget_mb: Optional[float] = None,
+                 log_path: str = "memory_profile.log", sample_interval: float = 5.0,
+                 snapshot_interval: float = 60.0, pressure_callback: Optional[Callable[[int], None]] = None,
+                 max_log_bytes: int = 10 * 1024 * 1024):
+        """
+        Args:
+            profile: tracemalloc 스냅샷 및 단계별 할당량 기록 여부
+            budget_mb: 메모리 예산 (MB, None이면 예산 관리 안 함)
+            log_path: 프로파일 로그 파일 경로 (JSON Lines)
+            sample_interval: RSS 샘플링 및 로그 기록 간격 (초)
+            snapshot_interval: tracemalloc 스냅샷 비교 간격 (초)
+            pressure_callback: 압박 단계가 바뀔 때 호출할 콜백 (인자: 새 단계)
+            max_log_bytes: 로그 파일 최대 크기 (넘으면 <log_path>.1로 교체, 백업 1개 유지)
+
+        프로파일링 없이 예산만 설정하면 압박 단계 변경 이벤트만 기록한다.
+        """
+        self.profile = profile
+        self.budget_bytes = int(budget_mb * 1024 * 1024) if budget_mb else None
+        self.release_ratio = 0.8  # 예산의 80% 아래로 내려가면 단계 완화
+        self.log_path = log_path
+        self.max_log_bytes = max_log_bytes
+        self.sample_interval = sample_interval
+        self.snapshot_interval = snapshot_interval
+        self.pressure_callback = pressure_callback
+        self.pressure_level = PRESSURE_NORMAL
+        self.last_rss: Optional[int] = None
+        self.stage_stats: Dict[str, Dict[str, int]] = {}  # 단계별 호출 수 / 최대·순증가 바이트
+        self._interval_peak = 0  # 단계 측정의 reset_peak() 때문에 따로 보관하는 구간 최대값
+        self.gc_stats = {"collections": 0, "pause_ms": 0.0, "max_pause_ms": 0.0}
+        self._gc_start: Optional[float] = None
+        self._last_sample = 0.0
+        self._last_snapshot = 0.0
+        self._prev_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._log_file = None
+        self._started = False
+
+    @property
+    def enabled(self) -> bool:
+        """프로파일링 또는 예산 관리가 켜져 있는지 여부"""
+        return self.profile or self.budget_bytes is not None
+
+    def start(self):
+        """모니터링 시작"""
+        if self._started or not self.enabled:
+            return
+        self._started = True
+        if self.profile:
+            tracemalloc.start()
+            gc.callbacks.append(self._on_gc)
+            self._last_snapshot = time.time()
+            self._prev_snapshot = self._take_snapshot()
+        self._write_log({"event": "start", "profile": self.profile, "budget_bytes": self.budget_bytes})
+
+    def stop(self):
+        """모니터링 종료 (마지막 샘플 기록 후 정리)"""
+        if not self._started:
+            return
+        self._sample(time.time())
+        self._write_log({"event": "stop"})
+        if self.profile:
+            if self._on_gc in gc.callbacks:
+                gc.callbacks.remove(self._on_gc)
+            tracemalloc.stop()
+            self._prev_snapshot = None
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        self._started = False
+
+    def _on_gc(self, phase, info):
+        """GC 정지 시간 측정 콜백"""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause_ms = (time.perf_counter() - self._gc_start) * 1000
+            self._gc_start = None
+            self.gc_stats["collections"] += 1
+            self.gc_stats["pause_ms"] += pause_ms
+            self.gc_stats["max_pause_ms"] = max(self.gc_stats["max_pause_ms"], pause_ms)
+
+    def stage(self, name: str):
+        """단계별 할당량 측정 컨텍스트 (프로파일링이 꺼져 있으면 아무것도 하지 않음)"""
+        if not self._started or not self.profile:
+            return contextlib.nullcontext()
+        return self._measure_stage(name)
+
+    @contextlib.contextmanager
+    def _measure_stage(self, name: str):
+        """tracemalloc 기준 단계 내 최대 사용량과 순증가량 기록
+
+        - peak_bytes_max / peak_bytes_sum: 단계 진입 시점 대비 단계 안에서 도달한
+          최대 증가량의 최댓값 / 합계 (할당 후 바로 해제된 임시 배열도 포함)
+        - net_bytes: 단계 종료 시점의 순증가량 합계
+        get_traced_memory()는 바이트만 제공하므로 할당 블록 수 변화는 스냅샷
+        로그(count_diff)에서 확인한다. reset_peak()를 사용하므로 단계는 중첩하지
+        않으며, 분석 스레드의 할당도 함께 집계된다.
+        """
+        before, peak = tracemalloc.get_traced_memory()
+        self._interval_peak = max(self._interval_peak, peak)  # 구간 최대값 보존
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self._interval_peak = max(self._interval_peak, peak)
+            peak_delta = max(peak - before, 0)
+            stats = self.stage_stats.setdefault(
+                name, {"calls": 0, "net_bytes": 0, "peak_bytes_max": 0, "peak_bytes_sum": 0}
+            )
+            stats["calls"] += 1
+            stats["net_bytes"] += current - before
+            stats["peak_bytes_max"] = max(stats["peak_bytes_max"], peak_delta)
+            stats["peak_bytes_sum"] += peak_delta
+
+    def tick(self):
+        """메인 루프에서 매 프레임 호출 (간격이 되었을 때만 샘플링)"""
+        if not self._started:
+            return
+        now = time.time()
+        if now - self._last_sample >= self.sample_interval:
+            self._sample(now)
+        if self.profile and now - self._last_snapshot >= self.snapshot_interval:
+            self._snapshot(now)
+
+    def _sample(self, now: float):
+        """RSS 샘플링, 로그 기록 및 예산 확인"""
+        self._last_sample = now
+        self.last_rss = get_rss_bytes()
+
+        entry = {"event": "sample", "rss_bytes": self.last_rss, "pressure_level": self.pressure_level}
+        if self.profile:
+            current, peak = tracemalloc.get_traced_memory()
+            entry["traced_bytes"] = current
+            entry["traced_peak_bytes"] = max(peak, self._interval_peak)
+            entry["stages"] = self.stage_stats
+            entry["gc"] = dict(self.gc_stats, counts=gc.get_count())
+            # 샘플 구간별 통계이므로 기록 후 초기화
+            self.stage_stats = {}
+            self.gc_stats = {"collections": 0, "pause_ms": 0.0, "max_pause_ms": 0.0}
+            tracemalloc.reset_peak()
+            self._interval_peak = 0
+        self._write_log(entry)
+
+        self._check_budget()
+
+    @staticmethod
+    def _take_snapshot() -> tracemalloc.Snapshot:
+        """tracemalloc 자체 및 import 관련 할당을 제외한 스냅샷"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def _snapshot(self, now: float):
+        """이전 스냅샷 대비 할당 증가 상위 항목 기록"""
+        self._last_snapshot = now
+        snapshot = self._take_snapshot()
+        top_stats = snapshot.compare_to(self._prev_snapshot, "lineno")[:10]
+        self._prev_snapshot = snapshot
+        self._write_log({
+            "event": "snapshot",
+            "top_growth": [
+                {"location": str(stat.traceback), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in top_stats
+            ]
+        })
+
+    def _check_budget(self):
+        """메모리 예산 초과 여부에 따라 압박 단계 조정 (샘플마다 한 단계씩)"""
+        if self.budget_bytes is None or self.last_rss is None:
+            return
+
+        level = self.pressure_level
+        if self.last_rss > self.budget_bytes:
+            level = min(level + 1, PRESSURE_CRITICAL)
+        elif self.last_rss < self.budget_bytes * self.release_ratio:
+            level = max(level - 1, PRESSURE_NORMAL)
+
+        if level != self.pressure_level:
+            self.pressure_level = level
+            self._write_log({"event": "pressure", "level": level, "rss_bytes": self.last_rss})
+            if self.pressure_callback:
+                self.pressure_callback(level)
+            # 위험 단계에 진입할 때 한 번만 수집 (콜백이 해제한 참조 포함)
+            if level == PRESSURE_CRITICAL:
+                gc.collect()
+
+    def _write_log(self, entry: Dict):
+        """로그 한 줄 기록 (필요 시 파일을 열고, 최대 크기를 넘으면 교체)"""
+        if not self._started:
+            return
+        # 예산 전용 모드에서는 압박 단계 변경만 기록
+        if not self.profile and entry.get("event") != "pressure":
+            return
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+        elif self._log_file.tell() >= self.max_log_bytes:
+            self._log_file.close()
+            os.replace(self.log_path, self.log_path + ".1")
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+        entry["time"] = time.time()
+        self._log_file.write(json.dumps(entry) + "\n")
+        self._log_file.flush()
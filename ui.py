@@ -5,17 +5,43 @@ GUI Application Module
 
 import customtkinter as ctk
 import cv2
+import numpy as np
+import os
 import threading
 from PIL import Image, ImageTk
 import time
 from typing import Optional
 from face_analyzer import FaceAnalyzer
+from frame_store import FrameRecorder, FrameReplaySource
+from memory_monitor import MemoryMonitor, PRESSURE_NORMAL, PRESSURE_REDUCED, PRESSURE_CRITICAL
 
 
 class App(ctk.CTk):
     """메인 UI 애플리케이션 클래스"""
 
-    def __init__(self):
+    # 감정 매핑
+    EMOTION_MAP = {
+        'angry': ('화남', '😡'),
+        'disgust': ('혐오', '🤢'),
+        'fear': ('두려움', '😨'),
+        'happy': ('행복', '😄'),
+        'sad': ('슬픔', '😢'),
+        'surprise': ('놀람', '😲'),
+        'neutral': ('평온', '😐')
+    }
+
+    def __init__(self, record_dir: Optional[str] = None, replay_dir: Optional[str] = None,
+                 replay_realtime: bool = True, replay_loop: bool = False, profile_memory: bool = False,
+                 memory_budget_mb: Optional[float] = None):
+        """
+        Args:
+            record_dir: 카메라 프레임을 녹화할 디렉터리 (None이면 녹화 안 함)
+            replay_dir: 카메라 대신 재생할 녹화 디렉터리 (None이면 웹캠 사용)
+            replay_realtime: 재생 시 원래 타이밍 유지 여부 (False면 최대 속도)
+            replay_loop: 재생이 끝나면 처음부터 반복할지 여부
+            profile_memory: 메모리 프로파일링 로그 기록 여부
+            memory_budget_mb: 메모리 예산 (MB, 초과 시 부하를 단계적으로 낮춤)
+        """
         super().__init__()
 
         # 윈도우 설정
@@ -40,10 +66,27 @@ class App(ctk.CTk):
 
         # 변수 초기화
         self.cap = None
-        self.analyzer = FaceAnalyzer(analysis_interval=15, loading_callback=self.update_loading_status)
+        self.base_analysis_interval = 15
+        self.analyzer = FaceAnalyzer(
+            analysis_interval=self.base_analysis_interval, loading_callback=self.update_loading_status
+        )
         self.is_running = False
         self.prev_time = 0
         self.is_camera_loading = False
+        self.record_dir = record_dir
+        self.replay_dir = replay_dir
+        self.replay_realtime = replay_realtime
+        self.replay_loop = replay_loop
+        self.recorder: Optional[FrameRecorder] = None
+        self.preview_max_width: Optional[int] = None  # 메모리 압박 시 미리보기 최대 너비
+
+        # 메모리 프로파일링 / 예산 관리
+        self.memory_monitor = MemoryMonitor(
+            profile=profile_memory,
+            budget_mb=memory_budget_mb,
+            pressure_callback=self._on_memory_pressure
+        )
+        self.memory_monitor.start()
 
     def _on_brightness_change(self, value):
         """밝기 슬라이더 변경 시 호출"""
@@ -228,6 +271,7 @@ class App(ctk.CTk):
         self.video_container.grid(row=0, column=1, sticky="nsew", padx=(10, 5), pady=10)
 
         self.video_label = ctk.CTkLabel(self.video_container, text="", cursor="cross")
+        self.video_label.imgtk = None
         self.video_label.pack(expand=True, fill="both", padx=2, pady=2)
 
         # 로딩 표시
@@ -257,12 +301,36 @@ class App(ctk.CTk):
             self.info_frame, "감지된 얼굴 수", "0 명", "👥"
         )
 
-        # 스크롤 가능한 얼굴 정보 영역
-        self.faces_scroll_frame = ctk.CTkScrollableFrame(self.info_frame, fg_color="transparent")
-        self.faces_scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # 얼굴 카드들을 저장할 딕셔너리
-        self.face_cards = {}
+        # 얼굴 정보 영역 (고정 개수의 카드를 재사용하는 가상화 목록)
+        self.faces_list_frame = ctk.CTkFrame(self.info_frame, fg_color="transparent")
+        self.faces_list_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.faces_list_frame.grid_columnconfigure(0, weight=1)
+        self.faces_list_frame.grid_rowconfigure(0, weight=1)
+
+        self.faces_cards_frame = ctk.CTkFrame(self.faces_list_frame, fg_color="transparent")
+        self.faces_cards_frame.grid(row=0, column=0, sticky="nsew")
+        # 카드 수에 따라 프레임이 늘어나지 않도록 고정하고, 실제 높이로 보이는 카드 수 계산
+        self.faces_cards_frame.pack_propagate(False)
+        self.faces_cards_frame.bind("<Configure>", self._on_faces_frame_configure)
+
+        self.faces_scrollbar = ctk.CTkScrollbar(self.faces_list_frame, command=self._on_faces_scroll)
+        self.faces_scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # 마우스 휠 스크롤 (Windows/macOS: MouseWheel, Linux: Button-4/5)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_all(sequence, self._on_faces_wheel, add="+")
+
+        # 카드 풀 (얼굴 수와 무관하게 위젯 개수 고정, 보이는 카드 수의 상한)
+        self.face_card_pool_size = 8
+        self.face_cards = [self.create_face_card(self.faces_cards_frame) for _ in range(self.face_card_pool_size)]
+        self.face_card_visible_count = 1  # 패널 높이에 들어가는 카드 수 (<Configure>에서 갱신)
+        self.face_card_offset = 0  # 첫 번째로 보이는 얼굴 번호
+        self.face_results = []  # 카드에 바인딩할 최신 분석 결과
+        self.face_count_text = "0 명"
+
+        # 대시보드 갱신 주기 제한 (초)
+        self.dashboard_interval = 0.25
+        self.last_dashboard_time = 0
 
         # FPS 표시
         self.fps_label = ctk.CTkLabel(
@@ -315,12 +383,24 @@ class App(ctk.CTk):
     def _init_camera_thread(self):
         """카메라 초기화 스레드"""
         try:
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap.isOpened():
-                raise Exception("No Webcam")
+            if self.replay_dir:
+                # 녹화된 프레임 재생 (카메라 없이 동일한 파이프라인 재현)
+                self.cap = FrameReplaySource(
+                    self.replay_dir, realtime=self.replay_realtime, loop=self.replay_loop
+                )
+                if not self.cap.isOpened():
+                    raise Exception("No Recording")
+            else:
+                self.cap = cv2.VideoCapture(0)
+                if not self.cap.isOpened():
+                    raise Exception("No Webcam")
+
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
 
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+            if self.record_dir and not self.replay_dir:
+                self.recorder = FrameRecorder(self._new_record_session_dir())
+                self.recorder.set_low_memory(self.memory_monitor.pressure_level >= PRESSURE_CRITICAL)
 
             self.is_running = True
             self.is_camera_loading = False
@@ -333,92 +413,175 @@ class App(ctk.CTk):
 
         except Exception as e:
             self.is_camera_loading = False
+            # 카메라/재생 소스가 열린 뒤 실패했으면 반드시 해제
+            if self.cap:
+                self.cap.release()
+                self.cap = None
             self.after(0, lambda: self.status_label.configure(
                 text="Error", text_color="red"
             ))
             self.after(0, lambda: self.start_btn.configure(state="normal"))
             self.after(0, self.hide_loading)
 
+    def _new_record_session_dir(self) -> str:
+        """녹화 세션마다 record_dir 아래 새 하위 디렉터리 경로 생성 (기존 녹화 보존)"""
+        base = os.path.join(self.record_dir, time.strftime("%Y%m%d_%H%M%S"))
+        session_dir = base
+        suffix = 1
+        while os.path.exists(session_dir):
+            session_dir = f"{base}_{suffix}"
+            suffix += 1
+        return session_dir
+
     def stop_camera(self):
         """카메라 정지"""
         self.is_running = False
         if self.cap:
             self.cap.release()
+        recording_failed = False
+        if self.recorder:
+            self.recorder.close()
+            recording_failed = self.recorder.error is not None
+            self.recorder = None
         self.video_label.configure(image=None)
-        self.status_label.configure(text="System Stopped", text_color="gray")
+        self.video_label.imgtk = None
+        if recording_failed:
+            self.status_label.configure(text="Recording Error", text_color="red")
+        else:
+            self.status_label.configure(text="System Stopped", text_color="gray")
         self.start_btn.configure(state="normal")
-        self.update_dashboard(None)
+        self.update_dashboard(None, force=True)
+
+    def update_dashboard(self, result, force: bool = False):
+        """우측 정보 패널 업데이트 (최대 dashboard_interval마다 한 번)"""
+        now = time.time()
+        if not force and now - self.last_dashboard_time < self.dashboard_interval:
+            return
+        self.last_dashboard_time = now
 
-    def update_dashboard(self, result):
-        """우측 정보 패널 업데이트"""
         # 모든 얼굴 결과 가져오기
-        all_results = self.analyzer.get_all_results()
-        face_count = len(all_results)
-        self.card_faces['value'].configure(text=f"{face_count} 명")
-        
-        # 감정 매핑
-        emotion_map = {
-            'angry': ('화남', '😡'),
-            'disgust': ('혐오', '🤢'),
-            'fear': ('두려움', '😨'),
-            'happy': ('행복', '😄'),
-            'sad': ('슬픔', '😢'),
-            'surprise': ('놀람', '😲'),
-            'neutral': ('평온', '😐')
-        }
+        self.face_results = self.analyzer.get_all_results()
+        self._render_face_cards()
+
+    def _render_face_cards(self):
+        """보이는 카드에만 결과 바인딩"""
+        face_count = len(self.face_results)
+        face_count_text = f"{face_count} 명"
+        if face_count_text != self.face_count_text:
+            self.card_faces['value'].configure(text=face_count_text)
+            self.face_count_text = face_count_text
+
+        # 얼굴 수가 줄어든 경우 스크롤 위치 보정
+        max_offset = max(0, face_count - self.face_card_visible_count)
+        self.face_card_offset = min(self.face_card_offset, max_offset)
+
+        for slot, card_data in enumerate(self.face_cards):
+            idx = self.face_card_offset + slot
+            if slot < self.face_card_visible_count and idx < face_count:
+                self._bind_face_card(card_data, idx, self.face_results[idx])
+                if not card_data['visible']:
+                    card_data['card'].pack(fill="x", padx=10, pady=5)
+                    card_data['visible'] = True
+            elif card_data['visible']:
+                # 남는 카드는 파괴하지 않고 숨겨서 재사용
+                card_data['card'].pack_forget()
+                card_data['visible'] = False
+                card_data['bound'] = None
+
+        if face_count > 0:
+            first = self.face_card_offset / face_count
+            last = min(1.0, (self.face_card_offset + self.face_card_visible_count) / face_count)
+        else:
+            first, last = 0.0, 1.0
+        self.faces_scrollbar.set(first, last)
+
+    def _bind_face_card(self, card_data, idx, face_result):
+        """카드 하나에 얼굴 결과 바인딩 (값이 바뀐 경우에만 위젯 갱신)"""
+        age = face_result.get('age', 0)
+        gender = face_result.get('dominant_gender', '?')
+        emotion = face_result.get('dominant_emotion', '?')
+
+        bound = (idx, age, gender, emotion)
+        if card_data['bound'] == bound:
+            return
+        card_data['bound'] = bound
 
-        # 기존 카드 중 제거할 것 찾기 (얼굴 수가 줄어든 경우)
-        current_face_count = len(self.face_cards)
-        if face_count < current_face_count:
-            for idx in range(face_count, current_face_count):
-                if idx in self.face_cards:
-                    self.face_cards[idx]['card'].destroy()
-                    del self.face_cards[idx]
+        emo_text, emo_icon = self.EMOTION_MAP.get(emotion.lower(), (emotion, '🤔'))
+        gender_text = '남성' if gender == 'Man' else '여성' if gender == 'Woman' else gender
+        gender_icon = '👨' if gender == 'Man' else '👩' if gender == 'Woman' else '👤'
 
-        # 각 얼굴마다 카드 업데이트 또는 생성
-        for idx, face_result in enumerate(all_results):
-            age = face_result.get('age', 0)
-            gender = face_result.get('dominant_gender', '?')
-            emotion = face_result.get('dominant_emotion', '?')
-
-            emo_text, emo_icon = emotion_map.get(emotion.lower(), (emotion, '🤔'))
-            gender_text = '남성' if gender == 'Man' else '여성' if gender == 'Woman' else gender
-            gender_icon = '👨' if gender == 'Man' else '👩' if gender == 'Woman' else '👤'
-
-            # 기존 카드가 있으면 업데이트, 없으면 생성
-            if idx in self.face_cards:
-                # 카드 업데이트
-                card_data = self.face_cards[idx]
-                card_data['header'].configure(
-                    text=f"Face {idx + 1}",
-                    text_color="#2CC985" if idx == 0 else "#FF6B6B"
-                )
-                card_data['age'].configure(text=f"{age}세")
-                card_data['gender_icon'].configure(text=gender_icon)
-                card_data['gender'].configure(text=gender_text)
-                card_data['emotion_icon'].configure(text=emo_icon)
-                card_data['emotion'].configure(
-                    text=emo_text,
-                    text_color="#2CC985" if emotion == 'happy' else "white"
-                )
-            else:
-                # 새 카드 생성
-                face_card = self.create_face_card(
-                    self.faces_scroll_frame,
-                    idx + 1,
-                    age,
-                    gender_text,
-                    gender_icon,
-                    emo_text,
-                    emo_icon,
-                    emotion == 'happy'
-                )
-                self.face_cards[idx] = face_card
+        card_data['header'].configure(
+            text=f"Face {idx + 1}",
+            text_color="#2CC985" if idx == 0 else "#FF6B6B"
+        )
+        card_data['age'].configure(text=f"{age}세")
+        card_data['gender_icon'].configure(text=gender_icon)
+        card_data['gender'].configure(text=gender_text)
+        card_data['emotion_icon'].configure(text=emo_icon)
+        card_data['emotion'].configure(
+            text=emo_text,
+            text_color="#2CC985" if emotion == 'happy' else "white"
+        )
+
+    def _set_face_card_offset(self, offset):
+        """스크롤 위치 변경 후 즉시 다시 바인딩"""
+        max_offset = max(0, len(self.face_results) - self.face_card_visible_count)
+        offset = max(0, min(offset, max_offset))
+        if offset != self.face_card_offset:
+            self.face_card_offset = offset
+            self._render_face_cards()
+
+    def _on_faces_frame_configure(self, event):
+        """얼굴 목록 크기 변경 시 실제로 보이는 카드 수 재계산"""
+        # 카드 실제 높이 + pack pady(5 * 2), 아직 계산되지 않았으면 대략값 사용
+        card_height = self.face_cards[0]['card'].winfo_reqheight()
+        if card_height <= 1:
+            card_height = 140
+        visible_count = max(1, min(self.face_card_pool_size, event.height // (card_height + 10)))
+        if visible_count != self.face_card_visible_count:
+            self.face_card_visible_count = visible_count
+            self._render_face_cards()
+
+    def _on_faces_scroll(self, *args):
+        """스크롤바 이동 시 호출 ('moveto', fraction) / ('scroll', n, 'units'|'pages')"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            offset = int(round(float(args[1]) * len(self.face_results)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= self.face_card_visible_count
+            offset = self.face_card_offset + step
+        else:
+            return
+        self._set_face_card_offset(offset)
+
+    @staticmethod
+    def _is_widget_within(widget, container) -> bool:
+        """widget이 container 자신이거나 그 하위 위젯인지 (경로 구성요소 단위 비교)"""
+        path, base = str(widget), str(container)
+        return path == base or path.startswith(base + ".")
 
-    def create_face_card(self, parent, face_num, age, gender_text, gender_icon, emotion_text, emotion_icon, is_happy):
-        """개별 얼굴 정보 카드 생성"""
+    def _on_faces_wheel(self, event):
+        """마우스 휠 스크롤 (포인터가 얼굴 목록 위에 있을 때만)"""
+        try:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            return
+        if widget is None or not self._is_widget_within(widget, self.faces_list_frame):
+            return
+        # 스크롤바는 자체 휠 바인딩으로 _on_faces_scroll을 호출하므로 중복 처리하지 않음
+        if self._is_widget_within(widget, self.faces_scrollbar):
+            return
+        if getattr(event, "num", None) == 4 or event.delta > 0:
+            self._set_face_card_offset(self.face_card_offset - 1)
+        else:
+            self._set_face_card_offset(self.face_card_offset + 1)
+
+    def create_face_card(self, parent):
+        """재사용할 빈 얼굴 정보 카드 생성 (pack은 바인딩 시 수행)"""
         card = ctk.CTkFrame(parent, fg_color="gray20", corner_radius=8)
-        card.pack(fill="x", padx=10, pady=5)
 
         # 얼굴 번호 헤더
         header_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -426,9 +589,8 @@ class App(ctk.CTk):
         
         header_label = ctk.CTkLabel(
             header_frame,
-            text=f"Face {face_num}",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#2CC985" if face_num == 1 else "#FF6B6B"
+            text="",
+            font=ctk.CTkFont(size=14, weight="bold")
         )
         header_label.pack(side="left")
 
@@ -440,28 +602,23 @@ class App(ctk.CTk):
         age_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
         age_frame.pack(fill="x", pady=2)
         ctk.CTkLabel(age_frame, text="🎂", font=ctk.CTkFont(size=16)).pack(side="left", padx=(0, 5))
-        age_label = ctk.CTkLabel(age_frame, text=f"{age}세", font=ctk.CTkFont(size=12))
+        age_label = ctk.CTkLabel(age_frame, text="", font=ctk.CTkFont(size=12))
         age_label.pack(side="left")
 
         # 성별
         gender_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
         gender_frame.pack(fill="x", pady=2)
-        gender_icon_label = ctk.CTkLabel(gender_frame, text=gender_icon, font=ctk.CTkFont(size=16))
+        gender_icon_label = ctk.CTkLabel(gender_frame, text="", font=ctk.CTkFont(size=16))
         gender_icon_label.pack(side="left", padx=(0, 5))
-        gender_label = ctk.CTkLabel(gender_frame, text=gender_text, font=ctk.CTkFont(size=12))
+        gender_label = ctk.CTkLabel(gender_frame, text="", font=ctk.CTkFont(size=12))
         gender_label.pack(side="left")
 
         # 감정
         emotion_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
         emotion_frame.pack(fill="x", pady=2)
-        emotion_icon_label = ctk.CTkLabel(emotion_frame, text=emotion_icon, font=ctk.CTkFont(size=16))
+        emotion_icon_label = ctk.CTkLabel(emotion_frame, text="", font=ctk.CTkFont(size=16))
         emotion_icon_label.pack(side="left", padx=(0, 5))
-        emotion_label = ctk.CTkLabel(
-            emotion_frame,
-            text=emotion_text,
-            font=ctk.CTkFont(size=12),
-            text_color="#2CC985" if is_happy else "white"
-        )
+        emotion_label = ctk.CTkLabel(emotion_frame, text="", font=ctk.CTkFont(size=12))
         emotion_label.pack(side="left")
 
         return {
@@ -471,7 +628,9 @@ class App(ctk.CTk):
             "gender_icon": gender_icon_label,
             "gender": gender_label,
             "emotion_icon": emotion_icon_label,
-            "emotion": emotion_label
+            "emotion": emotion_label,
+            "visible": False,  # 현재 pack 되어 있는지
+            "bound": None  # 마지막으로 바인딩한 값 (변경 감지용)
         }
 
     def update_video(self):
@@ -479,40 +638,46 @@ class App(ctk.CTk):
         if not self.is_running:
             return
 
-        ret, frame = self.cap.read()
+        monitor = self.memory_monitor
+        monitor.tick()
+
+        with monitor.stage("capture"):
+            ret, frame = self.cap.read()
         if not ret:
+            if isinstance(self.cap, FrameReplaySource) and self.cap.is_finished():
+                # 재생 종료: 폴링을 멈추고 완료 상태 표시
+                self.stop_camera()
+                self.status_label.configure(text="Replay finished", text_color="#2CC985")
+                return
             self.after(10, self.update_video)
             return
 
+        # 효과 적용 전 원본 프레임 녹화
+        if self.recorder:
+            with monitor.stage("record"):
+                self.recorder.write(frame)
+            if self.recorder.error is not None:
+                # 녹화 실패 (디스크 부족, 권한 등): 녹화만 중단하고 상태 표시
+                self.recorder.close()
+                self.recorder = None
+                self.status_label.configure(text="Recording Error", text_color="red")
+
         # 카메라 효과 적용 (좌우반전, 밝기, 대비, 흑백)
-        frame = self._apply_camera_effects(frame)
+        with monitor.stage("effects"):
+            frame = self._apply_camera_effects(frame)
 
         # 분석 및 데이터 갱신
-        self.analyzer.process_frame(frame)
-        result = self.analyzer.get_result()  # 첫 번째 얼굴 (대시보드용)
-        all_results = self.analyzer.get_all_results()  # 모든 얼굴
-        self.update_dashboard(result)
+        with monitor.stage("analysis"):
+            self.analyzer.process_frame(frame)
+            result = self.analyzer.get_result()  # 첫 번째 얼굴 (대시보드용)
+            all_results = self.analyzer.get_all_results()  # 모든 얼굴
+        with monitor.stage("dashboard"):
+            self.update_dashboard(result)
 
         # 여러 얼굴 박스 그리기
-        if self.show_overlay_var.get() and all_results:
-            for idx, face_result in enumerate(all_results):
-                region = face_result.get('region', {})
-                x, y, w, h = region.get('x', 0), region.get('y', 0), region.get('w', 0), region.get('h', 0)
-
-                if w > 0:
-                    # 얼굴 박스 (여러 명을 구분하기 위해 색상 변경)
-                    color = (44, 201, 133) if idx == 0 else (201, 44, 133)  # 첫 번째는 녹색, 나머지는 빨간색
-                    cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
-                    
-                    # 얼굴 번호 표시
-                    cv2.putText(frame, f"Face {idx + 1}", (x, y - 10),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
-                    
-                    # 반투명 배경 (첫 번째 얼굴만)
-                    if idx == 0:
-                        overlay = frame.copy()
-                        cv2.rectangle(overlay, (x, y), (x + w, y + h), (44, 201, 133), -1)
-                        cv2.addWeighted(overlay, 0.1, frame, 0.9, 0, frame)
+        with monitor.stage("overlay"):
+            if self.show_overlay_var.get() and all_results:
+                self._draw_overlay(frame, all_results)
 
         # FPS 계산
         curr_time = time.time()
@@ -521,6 +686,39 @@ class App(ctk.CTk):
         self.fps_label.configure(text=f"FPS: {int(fps)}")
 
         # 이미지 변환 및 출력
+        with monitor.stage("render"):
+            self._render_frame(frame)
+
+        self.after(10, self.update_video)
+
+    def _draw_overlay(self, frame, all_results):
+        """얼굴 박스 및 번호 그리기"""
+        frame_h, frame_w = frame.shape[:2]
+        for idx, face_result in enumerate(all_results):
+            region = face_result.get('region', {})
+            x, y, w, h = region.get('x', 0), region.get('y', 0), region.get('w', 0), region.get('h', 0)
+
+            if w > 0:
+                # 얼굴 박스 (여러 명을 구분하기 위해 색상 변경)
+                color = (44, 201, 133) if idx == 0 else (201, 44, 133)  # 첫 번째는 녹색, 나머지는 빨간색
+                cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
+                
+                # 얼굴 번호 표시
+                cv2.putText(frame, f"Face {idx + 1}", (x, y - 10),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                
+                # 반투명 배경 (첫 번째 얼굴만, 전체 프레임 복사 대신 얼굴 영역만 합성)
+                if idx == 0:
+                    x0, y0 = max(x, 0), max(y, 0)
+                    x1, y1 = min(x + w, frame_w), min(y + h, frame_h)
+                    if x1 > x0 and y1 > y0:
+                        roi = frame[y0:y1, x0:x1]
+                        tint = np.empty_like(roi)
+                        tint[:] = (44, 201, 133)
+                        cv2.addWeighted(tint, 0.1, roi, 0.9, 0, roi)
+
+    def _render_frame(self, frame):
+        """프레임을 비디오 라벨에 출력 (크기가 같으면 PhotoImage 재사용)"""
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         img = Image.fromarray(frame_rgb)
 
@@ -528,6 +726,10 @@ class App(ctk.CTk):
         display_w = self.video_container.winfo_width()
         display_h = self.video_container.winfo_height()
 
+        # 메모리 압박 시 미리보기 해상도 제한
+        if self.preview_max_width:
+            display_w = min(display_w, self.preview_max_width)
+
         if display_w > 10 and display_h > 10:
             img_ratio = img.width / img.height
             screen_ratio = display_w / display_h
@@ -539,13 +741,31 @@ class App(ctk.CTk):
                 new_w = display_w
                 new_h = int(new_w / img_ratio)
 
-            img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+            resample = Image.Resampling.BILINEAR if self.preview_max_width else Image.Resampling.LANCZOS
+            img = img.resize((new_w, new_h), resample)
 
-        imgtk = ImageTk.PhotoImage(image=img)
-        self.video_label.imgtk = imgtk
-        self.video_label.configure(image=imgtk)
+        imgtk = self.video_label.imgtk
+        if imgtk is not None and imgtk.width() == img.width and imgtk.height() == img.height:
+            imgtk.paste(img)
+        else:
+            imgtk = ImageTk.PhotoImage(image=img)
+            self.video_label.imgtk = imgtk
+            self.video_label.configure(image=imgtk)
 
-        self.after(10, self.update_video)
+    def _on_memory_pressure(self, level: int):
+        """메모리 압박 단계 변경 시 호출 (미리보기 해상도, 분석 빈도, 녹화 버퍼 조정)"""
+        self.preview_max_width = {PRESSURE_NORMAL: None, PRESSURE_REDUCED: 640}.get(level, 320)
+        self.analyzer.analysis_interval = self.base_analysis_interval * (2 ** level)
+
+        # 위험 단계에서는 녹화 청크를 작게 나눠 더티 memmap 페이지를 바로 디스크로 내보냄
+        if self.recorder:
+            self.recorder.set_low_memory(level >= PRESSURE_CRITICAL)
+
+        if level >= PRESSURE_CRITICAL:
+            # 캐시 해제: 분석 결과, 재생 중 이미 읽은 청크 memmap 페이지
+            self.analyzer.clear_results()
+            if isinstance(self.cap, FrameReplaySource):
+                self.cap.evict()
 
     def show_loading(self, text):
         """로딩 표시"""
@@ -566,6 +786,7 @@ class App(ctk.CTk):
     def on_closing(self):
         """앱 종료 시 처리"""
         self.stop_camera()
+        self.memory_monitor.stop()
         self.destroy()
 
 